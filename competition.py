@@ -1,6 +1,32 @@
 from race import *
 from runner import Runner
 from custom_errors import *
+from operator import itemgetter
+import heapq
+import math
+
+
+def _ordinal(n):
+    """
+    Returns the ordinal string for a given integer.
+
+    Args:
+        n (int): The integer to convert to an ordinal string.
+
+    Returns:
+        str: The ordinal string representation of the input integer (e.g., "1st", "2nd").
+
+    """
+    suffixes = {1: 'st', 2: 'nd', 3: 'rd'}
+    if 11 <= n % 100 <= 13:
+        suffix = 'th'
+    else:
+        suffix = suffixes.get(n % 10, 'th')
+    return f"{n}{suffix}"
+
+
+# Precomputed ordinal strings for the leaderboard positions "1st" to "256th"
+_ORDINALS = tuple(_ordinal(n) for n in range(1, 257))
 
 
 class Competition:
@@ -20,24 +46,6 @@ class Competition:
     """
     MAX_ROUNDS = 3
 
-    def __get_ordinal(self, n):
-        """
-        Returns the ordinal string for a given integer.
-
-        Args:
-            n (int): The integer to convert to an ordinal string.
-
-        Returns:
-            str: The ordinal string representation of the input integer (e.g., "1st", "2nd").
-
-        """
-        suffixes = {1: 'st', 2: 'nd', 3: 'rd'}
-        if 11 <= n % 100 <= 13:
-            suffix = 'th'
-        else:
-            suffix = suffixes.get(n % 10, 'th')
-        return f"{n}{suffix}"
-
     def __init__(self, runners: list, rounds: int, distances_short: list, distances_marathon: list):
         """
         Initializes a Competition object with the given parameters.
@@ -78,9 +86,26 @@ class Competition:
         self.distances_marathon = distances_marathon
 
         # Initialize the leaderboard with None for each ranking position
-        self.leaderboard = {}
+        self._leaderboard = {}
         for i in range(1, len(self.runners) + 1):
-            self.leaderboard[self.__get_ordinal(i)] = None
+            self._leaderboard[_ORDINALS[i - 1] if i <= len(_ORDINALS) else _ordinal(i)] = None
+        self._leaderboard_keys = list(self._leaderboard.keys())
+
+        # Each runner is identified by its position in self.runners
+        self._id_by_runner = {runner: runner_id for runner_id, runner in enumerate(self.runners)}
+        self._name_by_id = [runner.name for runner in self.runners]
+
+        # Running total of each runner's score, accumulated across races and indexed by runner id
+        self._totals = [0] * len(self.runners)
+        # Runner ids in the finishing order of the latest race, used to break ties in the rankings
+        self._last_order = []
+        # Whether each runner has taken part in any race so far, only those are on the leaderboard
+        self._has_raced = [False] * len(self.runners)
+        self._leaderboard_stale = False
+
+        # Per-runner time per kilometer stored as parallel lists, indexed like self.runners
+        self._sprint_km_times = [runner.run_short(1.0) for runner in self.runners]
+        self._endurance_km_times = [runner.run_km_long() for runner in self.runners]
 
     def conduct_competition(self):
         """
@@ -95,25 +120,18 @@ class Competition:
             dict: The final leaderboard after all rounds have been conducted.
 
         """
-        current_round = 1
-        i = 0
-        while current_round <= self.rounds:
+        for i in range(self.rounds):
             # Conduct the short race with all runners
-            short_race = ShortRace(self.distances_short[i], runners=self.runners)
-            short_race.runners = self.runners
-            short_result = self.conduct_race(short_race)
+            short_result = self._conduct_short_soa(self.distances_short[i])
 
             # Conduct the Marathon race with all runners
-            marathon = MarathonRace(self.distances_marathon[i], runners=self.runners)
-            marathon.runners = self.runners  # Assign runners to the marathon race
-            marathon_result = self.conduct_race(marathon)
+            marathon_result = self._conduct_marathon_soa(self.distances_marathon[i])
 
             # Recover energy for all DNF runners
             for runner, taken_time in marathon_result:
-                if taken_time == "DNF":
-                    runner.recover_energy(1000)
+                if math.isinf(taken_time):
+                    runner.reset_energy()
 
-            current_round += 1
             self.update_leaderboard(short_result)
             self.update_leaderboard(marathon_result)
 
@@ -132,40 +150,143 @@ class Competition:
         """
         return race.conduct_race()
 
+    def _conduct_short_soa(self, distance):
+        """
+        Conducts the short race of a round from the per-runner lists.
+
+        Args:
+            distance (float): The distance of the race in kilometers.
+
+        Returns:
+            list: The results of the race, as a list of tuples (runner, taken_time).
+
+        """
+        time_multiplier = ShortRace.TIME_MULTIPLIER
+        return [(runner, distance * km_time * time_multiplier)
+                for runner, km_time in zip(self.runners, self._sprint_km_times)]
+
+    def _conduct_marathon_soa(self, distance):
+        """
+        Conducts the marathon of a round from the per-runner lists.
+
+        The runners' energy is read once at the start and written back once the race is over.
+
+        Args:
+            distance (float): The distance of the race in kilometers.
+
+        Returns:
+            list: The results of the race, as a list of tuples (runner, taken_time),
+                where taken_time is math.inf for runners who did not finish.
+
+        """
+        kilometers = math.ceil(distance)
+        drain = MarathonRace.ENERGY_PER_KM
+        result = []
+        for runner, km_time in zip(self.runners, self._endurance_km_times):
+            time_taken, runner.energy = run_marathon(kilometers, km_time, runner.energy, drain)
+            result.append((runner, time_taken))
+        return result
+
+    @property
+    def leaderboard(self):
+        """
+        The current leaderboard, rebuilt from the running totals only when it is read.
+
+        Returns:
+            dict: The leaderboard, mapping ordinal strings to (runner_name, total_score) tuples.
+
+        """
+        if self._leaderboard_stale:
+            keys = self._leaderboard_keys
+            ranking = self._rank(len(keys))
+            ranking += [None] * (len(keys) - len(ranking))  # Positions not taken by any runner yet
+            for key, name_score in zip(keys, ranking):
+                self._leaderboard[key] = name_score
+            self._leaderboard_stale = False
+        return self._leaderboard
+
+    def get_top(self, k):
+        """
+        Returns the k runners with the highest total scores.
+
+        Every runner in the competition is ranked, including those who have not raced yet.
+
+        Args:
+            k (int): The number of runners to return.
+
+        Returns:
+            list: Up to k tuples of (runner_name, total_score), highest score first.
+
+        Raises:
+            CustomTypeError: If k is not an integer.
+            CustomValueError: If k is less than 1.
+
+        """
+        if not isinstance(k, int):
+            raise CustomTypeError("Invalid input type, please check the input types")
+        if k < 1:
+            raise CustomValueError("Invalid input value, please check the input values")
+        return self._rank(k, include_all=True)
+
+    def _rank(self, k, include_all=False):
+        """
+        Ranks the runners who have raced by total score.
+
+        Ties keep the finishing order of the latest race, followed by the runners who were not in it.
+
+        Args:
+            k (int): The number of top positions to rank.
+            include_all (bool, optional): Whether to also rank runners who have not raced yet. Defaults to False.
+
+        Returns:
+            list: Up to k tuples of (runner_name, total_score), highest score first.
+
+        """
+        totals = self._totals
+        names = self._name_by_id
+        in_latest = set(self._last_order)
+        candidates = self._last_order + [runner_id for runner_id, has_raced in enumerate(self._has_raced)
+                                         if (include_all or has_raced) and runner_id not in in_latest]
+        return [(names[runner_id], totals[runner_id])
+                for runner_id in heapq.nlargest(k, candidates, key=totals.__getitem__)]
+
     def update_leaderboard(self, results):
         """
         Updates the leaderboard based on the results of a race.
 
         This method calculates scores for each runner based on their finishing position in the race.
-        Runners who did not finish (DNF) receive a score of 0. The leaderboard is then updated
-        with the new scores, accumulating points over multiple rounds.
+        Runners who did not finish (DNF) receive a score of 0. The scores are added to each
+        runner's running total, and the leaderboard is rebuilt from the totals the next time it is read.
 
         Args:
-            results (list): The results of a race, as a list of tuples (runner, taken_time).
+            results (list): The results of a race, as a list of tuples (runner, taken_time),
+                where taken_time is math.inf for runners who did not finish.
+
+        Raises:
+            RunnerDoesntExistError: If a runner in the results is not part of the competition.
 
         """
         # Sort the race results based on the taken time
-        sorted_result = sorted(results, key=lambda x: x[1])
-        
-        # Get the list of leaderboard keys (e.g., "1st", "2nd")
-        leaderboard_keys = list(self.leaderboard.keys())
-        
-        # Create a dictionary mapping runner names to their scores in the current race
-        name2score = {runner.name: (len(results) - i - 1) if taken_time != "DNF" else 0 
-                     for i, (runner, taken_time) in enumerate(sorted_result)}
-
-        # Update scores based on previous leaderboard positions
-        for key in leaderboard_keys:
-            if self.leaderboard[key] is not None:
-                name, score = self.leaderboard[key]
-                name2score[name] += score
-        
-        # Sort the runners based on their accumulated scores
-        sorted_result = sorted(name2score.items(), key=lambda x: -x[1])
-        
-        # Update the leaderboard with the new rankings
-        for i, name_score in enumerate(sorted_result):
-            self.leaderboard[leaderboard_keys[i]] = name_score
+        sorted_result = sorted(results, key=itemgetter(1))
+
+        # Look up every runner's id before changing any totals
+        try:
+            order = [self._id_by_runner[runner] for runner, _ in sorted_result]
+        except KeyError:
+            raise RunnerDoesntExistError("Runner does not exist in the competition.") from None
+
+        # Add each runner's score in the current race to their running total
+        totals = self._totals
+        has_raced = self._has_raced
+        n = len(results)
+        for i, (runner_id, (_, taken_time)) in enumerate(zip(order, sorted_result)):
+            has_raced[runner_id] = True
+            if not math.isinf(taken_time):
+                totals[runner_id] += n - i - 1
+
+        # Defer rebuilding the leaderboard until it is next read
+        self._last_order = order
+        self._leaderboard_stale = True
 
     def print_leaderboard(self):
         """
@@ -1,8 +1,40 @@
 from custom_errors import *  # Import custom exceptions
 from abc import ABC, abstractmethod  # Import abstract base class tools
+from enum import IntEnum  # Import IntEnum for the race type codes
 from runner import Runner  # Import the Runner class
 import math  # Import math library for ceiling function
 
+def run_marathon(kilometers, time_per_km, energy, drain):
+    """
+    Runs a single runner through a marathon.
+
+    A kilometer can be started as long as the runner has any energy left, so the
+    result is computed in closed form from the number of kilometers the runner's
+    energy can cover rather than by stepping through each kilometer.
+
+    Args:
+        kilometers (int): The number of kilometers to run.
+        time_per_km (float): The time the runner takes to run a single kilometer.
+        energy (int): The energy the runner starts the race with.
+        drain (int): The amount of energy drained per kilometer.
+
+    Returns:
+        tuple: The time taken (or math.inf if the runner ran out of energy) and the remaining energy.
+    """
+    affordable = -(-max(energy, 0) // drain)  # Kilometers that can be started with the energy left
+    if affordable < kilometers:  # The runner runs out of energy before finishing
+        return math.inf, min(energy, 0)
+    return kilometers * time_per_km, max(energy - kilometers * drain, 0)
+
+
+class RaceType(IntEnum):
+    """
+    Integer codes for the race types, used instead of the race type strings when conducting races.
+    """
+    SHORT = 0
+    LONG = 1
+
+
 class Race(ABC):
     """
     Abstract base class for races.
@@ -20,6 +52,9 @@ class Race(ABC):
         remove_runner(runner): Removes a runner from the race.
         conduct_race(): Conducts the race and returns the results.
     """
+    TIME_MULTIPLIER = 1.2
+    ENERGY_PER_KM = 100
+
     def __init__(self, distance: float, runners: list | None = None, race_type: str = "short"):
         """
         Initializes a new Race object.
@@ -48,12 +83,22 @@ class Race(ABC):
         ):
             raise CustomValueError("Invalid input value, please check the input values")
         self.runners = runners  # Initialize runners attribute
-        self.race_type = race_type  # Initialize race_type attribute
+        self._rt = RaceType.SHORT if race_type == "short" else RaceType.LONG  # Resolve the race type code once
         self.distance = distance  # Initialize distance attribute
-        self.energy_per_km = 100  # Initialize energy_per_km attribute
-        self.maximum_participants = 8 if race_type == "short" else 16  # Initialize maximum_participants based on race_type
-        self.time_multiplier = 1.2  # Initialize time_multiplier attribute
+        self.energy_per_km = self.ENERGY_PER_KM  # Initialize energy_per_km attribute
+        self.maximum_participants = 8 if self._rt == RaceType.SHORT else 16  # Initialize maximum_participants based on race_type
+        self.time_multiplier = self.TIME_MULTIPLIER  # Initialize time_multiplier attribute
     
+    @property
+    def race_type(self):
+        """
+        The type of race, either "short" or "long". It is fixed when the race is created.
+
+        Returns:
+            str: The race type.
+        """
+        return "short" if self._rt == RaceType.SHORT else "long"
+
     def add_runner(self, runner):
         """
         Adds a runner to the race.
@@ -96,23 +141,18 @@ class Race(ABC):
         Conducts the race and returns the results.
 
         Returns:
-            list: A list of tuples, where each tuple contains a Runner object and their finishing time or "DNF" if they did not finish.
+            list: A list of tuples, where each tuple contains a Runner object and their finishing time or math.inf if they did not finish (DNF).
         """
         result = []  # Initialize an empty list to store the results
-        if self.race_type == "short":
-            for i, runner in enumerate(self.runners):  # Iterate over each runner in the race
-                time_taken = runner.run_race("short", self.distance) * self.time_multiplier  # Calculate the time taken for a short race
-                result.append((runner, time_taken))  # Add the runner and their time to the results list
-        elif self.race_type == "long":
-            for i, runner in enumerate(self.runners):  # Iterate over each runner in the race
-                time_taken = 0  # Initialize time taken to 0
-                for km in range(math.ceil(self.distance)):  # Iterate over each kilometer in the race
-                    if runner.energy > 0:  # Check if the runner has energy left
-                        time_taken += runner.run_race("long", 1.0)  # Add the time taken for 1 km to the total time
-                        runner.drain_energy(100)  # Drain the runner's energy by 100
-                    else:
-                        time_taken = 'DNF'  # If the runner runs out of energy, set time taken to "DNF"
-                        break  # Exit the loop if the runner did not finish
+        if self._rt == RaceType.SHORT:
+            distance = self.distance
+            time_multiplier = self.time_multiplier
+            # Compute every runner's time in a single pass, skipping run_race's per-call validation
+            result = [(runner, runner.run_short(distance) * time_multiplier) for runner in self.runners]
+        elif self._rt == RaceType.LONG:
+            kilometers = math.ceil(self.distance)  # Number of whole kilometers each runner has to cover
+            for runner in self.runners:  # Iterate over each runner in the race
+                time_taken, runner.energy = run_marathon(kilometers, runner.run_km_long(), runner.energy, self.energy_per_km)
                 result.append((runner, time_taken))  # Add the runner and their time to the results list
         return result  # Return the results list
 
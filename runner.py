@@ -1,6 +1,27 @@
 from custom_errors import *
+import csv
+import functools
+
+
+@functools.cache
+def _load_countries():
+    """
+    Loads the set of valid country names from countries.csv.
+
+    The file is only read the first time this is called, which is when the first Runner is created.
+
+    Returns:
+        frozenset: The country names listed in the fourth column of the file.
+    """
+    with open('countries.csv', 'r', newline='') as file:
+        reader = csv.reader(file)
+        next(reader)  # Skipping the header row
+        return frozenset(row[3] for row in reader)
+
 
 class Runner:
+    __slots__ = ('name', 'age', 'country', '_sprint_speed', '_endurance_speed', 'energy',
+                 '_sprint_s_per_km', '_endurance_s_per_km', '_endurance_km_time')
     max_energy = 1000
     def __init__(self, name: str, age: int, country: str, sprint_speed: float, endurance_speed: float):
         """
@@ -27,32 +48,51 @@ class Runner:
         ):
             raise CustomTypeError("Invalid input type, please check the input types")
 
-        valid_countries = set()
-        with open('countries.csv', 'r') as file:
-            file.readline()
-            for line in file:
-                valid_countries.add(line.strip().split(',')[3])
-
         # Checking input values
         if not (
             name.replace(' ', '').isalnum() and
             5 <= age <= 100 and
-            country in valid_countries and
+            country in _load_countries() and
             2.2 <= sprint_speed <= 6.8 and
             1.8 <= endurance_speed <= 5.4
         ):
             raise CustomValueError("Invalid input value, please check the input values")
 
         # Setting initial energy
-        self.max_energy = 1000
         self.energy = self.max_energy
 
         # Setting attributes
         self.name = name
         self.age = age
         self.country = country
-        self.sprint_speed = sprint_speed
-        self.endurance_speed = endurance_speed
+        self._sprint_speed = sprint_speed
+        self._endurance_speed = endurance_speed
+
+        # Caching the time per kilometer, as the speeds are read-only after creation,
+        # so race times are computed with a multiplication instead of a division
+        self._sprint_s_per_km = 1000.0 / sprint_speed
+        self._endurance_s_per_km = 1000.0 / endurance_speed
+        self._endurance_km_time = round(self._endurance_s_per_km, 2)
+
+    @property
+    def sprint_speed(self):
+        """
+        The sprint speed of the runner in meters per second, fixed when the runner is created.
+
+        Returns:
+            float: The sprint speed.
+        """
+        return self._sprint_speed
+
+    @property
+    def endurance_speed(self):
+        """
+        The endurance speed of the runner in meters per second, fixed when the runner is created.
+
+        Returns:
+            float: The endurance speed.
+        """
+        return self._endurance_speed
 
     def drain_energy(self, drain_points: int):
         """
@@ -102,6 +142,12 @@ class Runner:
         if self.energy > self.max_energy:
             self.energy = self.max_energy
 
+    def reset_energy(self):
+        """
+        Restores the runner's energy to its maximum.
+        """
+        self.energy = self.max_energy
+
     def run_race(self, race_type, distance):
         #raise ValueError(f'{race_type} {distance}')
         valid_race_types = ['short', 'long']
@@ -114,15 +160,36 @@ class Runner:
         if distance <= 0:
             raise CustomValueError('')
 
-        distance_meters = distance * 1000
-
         if race_type == 'short':
-            time_taken = distance_meters / self.sprint_speed
+            time_taken = distance * self._sprint_s_per_km
         else:
-            time_taken = distance_meters / self.endurance_speed
+            time_taken = distance * self._endurance_s_per_km
 
         return round(time_taken, 2)
 
+    def run_short(self, distance):
+        """
+        Returns the time taken to sprint the given distance, without validating the input.
+
+        Unlike run_race, the time is not rounded, as it is only used to order the runners in a race.
+
+        Args:
+            distance (float): The distance of the race in kilometers.
+
+        Returns:
+            float: The time taken in seconds.
+        """
+        return distance * self._sprint_s_per_km
+
+    def run_km_long(self):
+        """
+        Returns the time taken to run a single kilometer at endurance speed.
+
+        Returns:
+            float: The time taken in seconds, rounded to 2 decimal places.
+        """
+        return self._endurance_km_time
+
     def __str__(self):
         """
         Returns a string representation of the Runner object.
@@ -1,7 +1,7 @@
 import unittest
 from competition import Competition
 from runner import Runner
-from custom_errors import CustomTypeError, CustomValueError
+from custom_errors import CustomTypeError, CustomValueError, RunnerDoesntExistError
 from race import Race, ShortRace, MarathonRace
 
 
@@ -87,6 +87,20 @@ class TestCompetition(unittest.TestCase):
         '5th': ('Rupert', 0)}
         self.assertEqual(leaderboard, expected_leaderboard, f"Invalid leaderboard. Check points logic {expected_leaderboard}")
 
+    def test_conduct_competition_uses_round_distances(self):
+        # The round 2 marathon of 11km is too long for everyone, so the whole field DNFs and recovers
+        competition = Competition(self.runners, 2, [0.5, 0.6], [4.0, 11.0])
+        leaderboard = competition.conduct_competition()
+
+        for runner in self.runners:
+            self.assertEqual(runner.energy, 1000)
+        expected_leaderboard = {'1st': ('Elijah', 12),
+        '2nd': ('Lauren', 7),
+        '3rd': ('Chloe', 7),
+        '4th': ('Phoebe', 4),
+        '5th': ('Rupert', 0)}
+        self.assertEqual(leaderboard, expected_leaderboard)
+
     def test_conduct_race(self):
         # Use real race classes for testing
         short_race = SimpleShortRace(0.5, self.runners)
@@ -101,6 +115,27 @@ class TestCompetition(unittest.TestCase):
         self.assertLess(short_result[0][1], short_result[1][1])  # 1st should be faster than 2nd
         self.assertLess(marathon_result[0][1], marathon_result[1][1])  # 1st should be faster than 2nd
 
+    def test_conduct_short_soa(self):
+        # Short race times should match the runners' own sprint times with the multiplier applied
+        results = self.competition._conduct_short_soa(0.5)
+        self.assertEqual([runner for runner, _ in results], self.runners)
+        for runner, taken_time in results:
+            self.assertAlmostEqual(taken_time, runner.run_race('short', 0.5) * 1.2, places=1)
+
+    def test_conduct_marathon_soa(self):
+        # Every runner finishes 4km and the energy used is written back to the runners
+        results = self.competition._conduct_marathon_soa(4.0)
+        self.assertEqual([runner for runner, _ in results], self.runners)
+        for runner, taken_time in results:
+            self.assertAlmostEqual(taken_time, 4 * runner.run_race('long', 1.0), places=2)
+            self.assertEqual(runner.energy, 600)
+
+        # Nobody has enough energy left for 7km
+        results = self.competition._conduct_marathon_soa(7.0)
+        for runner, taken_time in results:
+            self.assertEqual(taken_time, float('inf'))
+            self.assertEqual(runner.energy, 0)
+
     def test_update_leaderboard(self):
         # Define test results for updating the leaderboard
         race_results = [(self.runners[0], 10.0), (self.runners[1], 12.0), (self.runners[2], 14.0)]
@@ -116,6 +151,78 @@ class TestCompetition(unittest.TestCase):
         }
         self.assertEqual(self.competition.leaderboard, expected_leaderboard)
 
+    def test_update_leaderboard_dnf(self):
+        # Runners who did not finish should score 0 and sort after finishers
+        race_results = [(self.runners[0], float('inf')), (self.runners[1], 12.0), (self.runners[2], 14.0)]
+        self.competition.update_leaderboard(race_results)
+
+        expected_leaderboard = {
+            '1st': ('Rupert', 2),
+            '2nd': ('Phoebe', 1),
+            '3rd': ('Elijah', 0),
+            '4th': None,
+            '5th': None
+        }
+        self.assertEqual(self.competition.leaderboard, expected_leaderboard)
+
+    def test_update_leaderboard_keeps_absent_runners(self):
+        # Runners missing from the latest race should keep their earlier scores on the leaderboard
+        self.competition.update_leaderboard([(self.runners[0], 1.0), (self.runners[1], 2.0), (self.runners[2], 3.0)])
+        self.competition.update_leaderboard([(self.runners[3], 1.0), (self.runners[4], 2.0)])
+
+        expected_leaderboard = {
+            '1st': ('Elijah', 2),
+            '2nd': ('Lauren', 1),
+            '3rd': ('Rupert', 1),
+            '4th': ('Chloe', 0),
+            '5th': ('Phoebe', 0)
+        }
+        self.assertEqual(self.competition.leaderboard, expected_leaderboard)
+
+    def test_update_leaderboard_unknown_runner(self):
+        # Results for a runner outside the competition are rejected without changing the scores
+        outsider = Runner("Yaakov", 20, 'Switzerland', 2.4, 2.4)
+        with self.assertRaises(RunnerDoesntExistError):
+            self.competition.update_leaderboard([(self.runners[0], 10.0), (outsider, 12.0)])
+        self.assertEqual(self.competition.get_top(1), [('Elijah', 0)])
+
+    def test_get_top(self):
+        # Only the k best runners should be returned, highest score first
+        race_results = [(self.runners[0], 10.0), (self.runners[1], 12.0), (self.runners[2], 14.0)]
+        self.competition.update_leaderboard(race_results)
+        self.assertEqual(self.competition.get_top(2), [('Elijah', 2), ('Rupert', 1)])
+
+        with self.assertRaises(CustomTypeError):
+            self.competition.get_top(2.0)
+
+        with self.assertRaises(CustomValueError):
+            self.competition.get_top(0)
+
+    def test_get_top_before_races(self):
+        # Before any race every runner is ranked with a score of 0
+        self.assertEqual(self.competition.get_top(2), [('Elijah', 0), ('Rupert', 0)])
+        self.assertEqual(len(self.competition.get_top(10)), len(self.runners))
+
+    def test_get_top_includes_absent_runners(self):
+        # Runners missing from the latest race are still ranked by their total
+        self.competition.update_leaderboard([(self.runners[0], 1.0), (self.runners[1], 2.0), (self.runners[2], 3.0)])
+        self.competition.update_leaderboard([(self.runners[3], 1.0), (self.runners[4], 2.0)])
+        self.assertEqual(self.competition.get_top(1), [('Elijah', 2)])
+
+    def test_update_leaderboard_accumulates(self):
+        # Scores from consecutive races should be added together
+        self.competition.update_leaderboard([(self.runners[0], 10.0), (self.runners[1], 12.0), (self.runners[2], 14.0)])
+        self.competition.update_leaderboard([(self.runners[0], 14.0), (self.runners[1], 10.0), (self.runners[2], 12.0)])
+
+        expected_leaderboard = {
+            '1st': ('Rupert', 3),
+            '2nd': ('Elijah', 2),
+            '3rd': ('Phoebe', 1),
+            '4th': None,
+            '5th': None
+        }
+        self.assertEqual(self.competition.leaderboard, expected_leaderboard)
+
 
 if __name__ == '__main__':
     unittest.main()
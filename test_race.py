@@ -1,6 +1,7 @@
+import math
 import unittest
 from custom_errors import RunnerAlreadyExistsError, RunnerDoesntExistError
-from race import Race, ShortRace, MarathonRace
+from race import Race, RaceType, ShortRace, MarathonRace, run_marathon
 from runner import Runner
 
 class TestRaces(unittest.TestCase):
@@ -22,6 +23,22 @@ class TestRaces(unittest.TestCase):
         self.assertEqual(marathon_race.maximum_participants, 16)
         self.assertEqual(marathon_race.energy_per_km, 100)
     
+    def test_race_type(self):
+        # The race type string and code are derived from each other and cannot be changed
+        short_race = ShortRace(0.5, [])
+        marathon_race = MarathonRace(4.0, [])
+        self.assertEqual(short_race._rt, RaceType.SHORT)
+        self.assertEqual(marathon_race._rt, RaceType.LONG)
+        with self.assertRaises(AttributeError):
+            short_race.race_type = 'long'
+
+        # Conducting a race branches on the code: only the marathon drains energy
+        runner = Runner('Lauren', 20, 'Australia', 2.4, 2.4)
+        ShortRace(4.0, [runner]).conduct_race()
+        self.assertEqual(runner.energy, 1000)
+        MarathonRace(4.0, [runner]).conduct_race()
+        self.assertEqual(runner.energy, 600)
+
     def test_add_runner(self):
         # Create a short race and a runner
         short_race = ShortRace(0.5, [])
@@ -90,10 +107,23 @@ class TestRaces(unittest.TestCase):
         # Conduct the race and get the results
         results = marathon.conduct_race()
         
-        # Both runners should run out of energy and get 'DNF'
+        # Both runners should run out of energy and get an infinite time (DNF)
         self.assertIsInstance(results, list, f"Results returned from short race's conduct race should be a list")
         list_of_racer_times = [y[1] for y in results]
-        self.assertIn("DNF", list_of_racer_times, f"Runner John should DNF but didn't")
+        self.assertIn(math.inf, list_of_racer_times, f"Runner John should DNF but didn't")
+
+    def test_run_marathon_partial_energy(self):
+        # 550 energy can still start a 6th kilometer, but not a 7th
+        self.assertEqual(run_marathon(6, 250.0, 550, 100), (1500.0, 0))
+        self.assertEqual(run_marathon(7, 250.0, 550, 100), (math.inf, 0))
+
+    def test_run_marathon_no_energy(self):
+        # A runner starting without energy does not finish and keeps 0 energy
+        self.assertEqual(run_marathon(1, 250.0, 0, 100), (math.inf, 0))
+
+    def test_run_marathon_energy_left(self):
+        # Finishing with energy to spare leaves the rest of the energy
+        self.assertEqual(run_marathon(4, 250.0, 1000, 100), (1000.0, 600))
 
 if __name__ == '__main__':
     unittest.main()
@@ -1,5 +1,5 @@
 from custom_errors import *
-from runner import Runner
+from runner import Runner, _load_countries
 import unittest
 
 class TestRunner(unittest.TestCase):
@@ -27,6 +27,20 @@ class TestRunner(unittest.TestCase):
         with self.assertRaises(CustomValueError):
             Runner('Elijah', 25, 'Australia', 6.5, 4.0)
 
+    def test_countries_loaded_once(self):
+        """Test case for the valid countries being parsed only once."""
+        self.assertIs(_load_countries(), _load_countries())
+        self.assertIn('Australia', _load_countries())
+
+    def test_speeds_read_only(self):
+        """Test case for the speeds not being changeable, as race times are cached from them."""
+        with self.assertRaises(AttributeError):
+            self.runner.sprint_speed = 2.5
+        with self.assertRaises(AttributeError):
+            self.runner.endurance_speed = 2.5
+        self.assertEqual(self.runner.sprint_speed, 6.5)
+        self.assertAlmostEqual(self.runner.run_race('short', 1.0), 153.85, places=2)
+
     def test_drain_energy_valid_input(self):
         """Test case for valid input to drain_energy method."""
         self.runner.drain_energy(200)
@@ -54,6 +68,12 @@ class TestRunner(unittest.TestCase):
         self.runner.recover_energy(500)
         self.assertEqual(self.runner.energy, 1000)
 
+    def test_reset_energy(self):
+        """Test case for restoring energy to its maximum."""
+        self.runner.drain_energy(1000)
+        self.runner.reset_energy()
+        self.assertEqual(self.runner.energy, 1000)
+
     def test_recover_energy_invalid_input_type(self):
         """Test case for invalid input type to recover_energy method."""
         with self.assertRaises(CustomTypeError):
@@ -69,6 +89,14 @@ class TestRunner(unittest.TestCase):
         time_taken = self.runner.run_race('long', 5.0)
         self.assertAlmostEqual(time_taken, 1250.00, places=2)
 
+    def test_run_short_matches_run_race(self):
+        """Test case for the unvalidated short race path."""
+        self.assertAlmostEqual(self.runner.run_short(2.0), self.runner.run_race('short', 2.0), places=2)
+
+    def test_run_km_long(self):
+        """Test case for the cached time per kilometer at endurance speed."""
+        self.assertEqual(self.runner.run_km_long(), 250.0)
+
     def test_run_race_invalid_race_type(self):
         """Test case for invalid race type input to run_race method."""
         with self.assertRaises(CustomValueError):